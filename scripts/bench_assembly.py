@@ -0,0 +1,96 @@
+"""Times the assembly backends for a representative cutout panel.
+
+Run with a mesh-refinement argument to sweep problem sizes, e.g.:
+
+    python scripts/bench_assembly.py 40 80 160
+
+Reports the cold (first-call, includes numba compilation unless a disk
+cache from an earlier run exists) and warm assembly times of the jitted
+loop core, the pure-NumPy broadcast path, and the matrix-free matvec, so
+the compiled-extension question can be answered with numbers: with
+njit(cache=True) the compiled kernels persist in __pycache__ and the
+cold-start penalty is paid once per machine, not once per run.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from panl.analysis import kernels
+from panl.analysis import solver as solver_mod
+from panl.analysis.geometry import CircularCutout, PanelGeometry
+from panl.analysis.kernels import BEMKernels
+from panl.analysis.material import OrthotropicMaterial
+from panl.analysis.solver import BEMSolver
+
+
+def make_solver(n_side: int, **kwargs) -> BEMSolver:
+    E, nu = 10.5e6, 0.33
+    mat = OrthotropicMaterial(
+        e1=E, e2=E * 1.001, nu12=nu, g12=E / (2 * (1 + nu)), thickness=0.08
+    )
+    geom = PanelGeometry(30.0, 15.0)
+    geom.add_cutout(CircularCutout(15.0, 7.5, 1.5))
+    geom.discretize(num_elements_per_side=n_side, num_elements_cutout=2 * n_side)
+    return BEMSolver(BEMKernels(mat), geom, **kwargs)
+
+
+def bench(fn, repeats: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sides = [int(a) for a in sys.argv[1:]] or [40, 80]
+
+    for n_side in sides:
+        solver = make_solver(n_side)
+        n = solver.M
+        print(f"\nN = {n} elements ({2 * n} DOF)")
+
+        if kernels.HAVE_NUMBA:
+            t_cold = bench(solver.assemble, repeats=1)
+            print(f"  numba assemble (cold):  {t_cold:8.3f} s")
+            t_warm = bench(solver.assemble)
+            print(f"  numba assemble (warm):  {t_warm:8.3f} s")
+        else:
+            print("  numba not installed; skipping jitted path")
+
+        # Broadcast path: what the solver falls back to without numba
+        # (the solver module holds its own HAVE_NUMBA binding)
+        idx = np.arange(n)
+        have = solver_mod.HAVE_NUMBA
+        solver_mod.HAVE_NUMBA = False
+        try:
+            t_bcast = bench(lambda: solver._kernel_blocks(idx, idx))
+        finally:
+            solver_mod.HAVE_NUMBA = have
+        print(f"  numpy broadcast blocks: {t_bcast:8.3f} s")
+
+        mf = make_solver(n_side, method="matrix_free")
+        mf.assemble()
+        x = np.random.default_rng(0).standard_normal(2 * n)
+        t_mv = bench(lambda: mf.apply(x))
+        print(f"  matrix-free matvec:     {t_mv:8.3f} s")
+
+        # Single vs double precision direct solve: LAPACK moves half the
+        # bytes and packs twice the lanes per SIMD register in fp32.
+        for dtype in (np.float64, np.float32):
+            ds = make_solver(n_side, dtype=dtype)
+            ds.assemble()
+
+            def factor_and_solve():
+                ds._lu = None  # force refactorization each repeat
+                ds.solve(qx=500.0)
+
+            t_solve = bench(factor_and_solve)
+            print(f"  dense factor+solve {np.dtype(dtype).name}: {t_solve:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,14 @@ from typing import List
 
 import numpy as np
 
+# Integer edge tags assigned at mesh generation, so edge membership is an
+# exact integer compare instead of a floating-point coordinate test.
+EDGE_NONE = 0  # cutout / interior boundary
+EDGE_LEFT = 1
+EDGE_RIGHT = 2
+EDGE_BOTTOM = 3
+EDGE_TOP = 4
+
 
 class BoundaryElement:
     """
@@ -9,10 +17,18 @@ class BoundaryElement:
     traction/displacement assumption.
     """
 
-    def __init__(self, p1: np.ndarray, p2: np.ndarray, tag: str = "outer"):
+    # Meshes hold tens of thousands of these; slots skip the per-instance
+    # __dict__, shrinking each element and speeding up attribute access in
+    # the remaining object-level loops.
+    __slots__ = ("p1", "p2", "tag", "edge", "center", "dx", "dy", "length", "nx", "ny")
+
+    def __init__(
+        self, p1: np.ndarray, p2: np.ndarray, tag: str = "outer", edge: int = EDGE_NONE
+    ):
         self.p1 = p1  # Start point (x, y)
         self.p2 = p2  # End point (x, y)
         self.tag = tag  # 'outer' or 'cutout'
+        self.edge = edge  # EDGE_* constant for panel-edge membership
         self.center = (p1 + p2) / 2.0
         self.dx = p2[0] - p1[0]
         self.dy = p2[1] - p1[1]
@@ -44,6 +60,22 @@ class PanelGeometry:
         """
         Discretizes the panel outer boundary and all cutouts.
 
+        Elements are emitted in panel-wise order -- bottom, right, top,
+        left, then each cutout -- with every run contiguous in the global
+        numbering and sorted by arc length along its boundary. Spatially
+        neighboring elements therefore sit in neighboring matrix rows,
+        which keeps assembly and boundary-stress differencing cache
+        friendly; downstream code may rely on this ordering.
+
+        In addition to the element list, struct-of-arrays buffers are stored
+        on the geometry (``centers``, ``normals``, ``lengths``) so hot code
+        paths can operate on contiguous ndarrays instead of iterating the
+        Python objects. Edge membership is recorded as index arrays
+        (``bottom_idx``, ``right_idx``, ``top_idx``, ``left_idx``,
+        ``cutout_idx``) while the elements are emitted, along with an
+        ``edge_tags`` int8 array of EDGE_* constants, so boundary
+        conditions can be assigned without coordinate comparisons.
+
         Args:
             num_elements_per_side: Number of elements for each side of the panel.
             num_elements_cutout: Number of elements for each cutout.
@@ -54,28 +86,39 @@ class PanelGeometry:
         elements = []
 
         # Outer boundary (Rectangular)
+        # Global element indices for each edge are recorded as they are
+        # emitted, so edge membership is pure bookkeeping downstream
+        # (no floating-point comparisons against the panel extents).
         # 1. Bottom side: (0,0) to (W, 0)
         elements.extend(
             self._discretize_line(
-                np.array([0, 0]), np.array([self.width, 0]), num_elements_per_side
+                np.array([0, 0]),
+                np.array([self.width, 0]),
+                num_elements_per_side,
+                edge=EDGE_BOTTOM,
             )
         )
+        bottom_end = len(elements)
         # 2. Right side: (W,0) to (W, H)
         elements.extend(
             self._discretize_line(
                 np.array([self.width, 0]),
                 np.array([self.width, self.height]),
                 num_elements_per_side,
+                edge=EDGE_RIGHT,
             )
         )
+        right_end = len(elements)
         # 3. Top side: (W, H) to (0, H)
         elements.extend(
             self._discretize_line(
                 np.array([self.width, self.height]),
                 np.array([0, self.height]),
                 num_elements_per_side,
+                edge=EDGE_TOP,
             )
         )
+        top_end = len(elements)
         # 4. Left side: (0, H) to (0, 0)
         elements.extend(
             self._discretize_line(
@@ -83,18 +126,39 @@ class PanelGeometry:
                 np.array([0, 0]),
                 num_elements_per_side,
                 tag="outer",
+                edge=EDGE_LEFT,
             )
         )
+        left_end = len(elements)
 
         # Cutouts
         for cutout in self.cutouts:
             elements.extend(cutout.discretize(num_elements_cutout))
 
+        self.bottom_idx = np.arange(0, bottom_end, dtype=np.intp)
+        self.right_idx = np.arange(bottom_end, right_end, dtype=np.intp)
+        self.top_idx = np.arange(right_end, top_end, dtype=np.intp)
+        self.left_idx = np.arange(top_end, left_end, dtype=np.intp)
+        self.cutout_idx = np.arange(left_end, len(elements), dtype=np.intp)
+
         self.elements = elements
+
+        # Struct-of-arrays view of the mesh: contiguous float64 buffers
+        # consumed directly by assembly and BC construction.
+        self.centers = np.array([el.center for el in elements], dtype=np.float64)
+        self.normals = np.array([[el.nx, el.ny] for el in elements], dtype=np.float64)
+        self.lengths = np.array([el.length for el in elements], dtype=np.float64)
+        self.edge_tags = np.array([el.edge for el in elements], dtype=np.int8)
+
         return elements
 
     def _discretize_line(
-        self, p1: np.ndarray, p2: np.ndarray, num_els: int, tag: str = "outer"
+        self,
+        p1: np.ndarray,
+        p2: np.ndarray,
+        num_els: int,
+        tag: str = "outer",
+        edge: int = EDGE_NONE,
     ) -> List[BoundaryElement]:
         """
         Discretizes a straight line into elements.
@@ -104,6 +168,7 @@ class PanelGeometry:
             p2: End point.
             num_els: Number of elements.
             tag: Tag for the elements.
+            edge: EDGE_* constant for panel-edge membership.
 
         Returns:
             List[BoundaryElement]: List of line elements.
@@ -111,7 +176,7 @@ class PanelGeometry:
         els = []
         pts = np.linspace(p1, p2, num_els + 1)
         for i in range(num_els):
-            els.append(BoundaryElement(pts[i], pts[i + 1], tag=tag))
+            els.append(BoundaryElement(pts[i], pts[i + 1], tag=tag, edge=edge))
         return els
 
 
@@ -121,6 +186,9 @@ class Cutout:
     def discretize(self, num_elements: int) -> List[BoundaryElement]:
         raise NotImplementedError
 
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
 
 class CircularCutout(Cutout):
     """Circular cutout definition."""
@@ -153,6 +221,19 @@ class CircularCutout(Cutout):
             els.append(BoundaryElement(pts[i], pts[i + 1], tag="cutout"))
         return els
 
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """
+        Tests which points fall inside the circular cutout.
+
+        Args:
+            points: (N, 2) array of points.
+
+        Returns:
+            np.ndarray: Boolean mask of length N.
+        """
+        d2 = (points[:, 0] - self.xc) ** 2 + (points[:, 1] - self.yc) ** 2
+        return d2 < self.r**2
+
 
 class EllipticalCutout(Cutout):
     """Elliptical cutout definition."""
@@ -199,3 +280,21 @@ class EllipticalCutout(Cutout):
         for i in range(num_elements):
             els.append(BoundaryElement(pts[i], pts[i + 1], tag="cutout"))
         return els
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """
+        Tests which points fall inside the elliptical cutout.
+
+        Args:
+            points: (N, 2) array of points.
+
+        Returns:
+            np.ndarray: Boolean mask of length N.
+        """
+        c, s = np.cos(self.theta), np.sin(self.theta)
+        dx = points[:, 0] - self.xc
+        dy = points[:, 1] - self.yc
+        # Rotate into ellipse coords
+        xi = dx * c + dy * s
+        eta = -dx * s + dy * c
+        return (xi / self.a) ** 2 + (eta / self.b) ** 2 < 1.0
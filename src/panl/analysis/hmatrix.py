@@ -0,0 +1,284 @@
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+# A block evaluator returns the (2m, 2n) sub-matrix for the given
+# source/field element index sets.
+BlockFunc = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+class ClusterNode:
+    """
+    Node of a geometric cluster tree over element centers.
+
+    Built by recursive bisection along the longest bounding-box axis,
+    so every node owns a spatially compact set of elements.
+    """
+
+    def __init__(self, indices: np.ndarray, centers: np.ndarray, leaf_size: int = 32):
+        self.indices = indices
+        pts = centers[indices]
+        self.bbox_min = pts.min(axis=0)
+        self.bbox_max = pts.max(axis=0)
+        self.diameter = float(np.linalg.norm(self.bbox_max - self.bbox_min))
+        self.children: List["ClusterNode"] = []
+
+        if len(indices) > leaf_size:
+            axis = int(np.argmax(self.bbox_max - self.bbox_min))
+            order = np.argsort(pts[:, axis])
+            half = len(indices) // 2
+            self.children = [
+                ClusterNode(indices[order[:half]], centers, leaf_size),
+                ClusterNode(indices[order[half:]], centers, leaf_size),
+            ]
+
+
+def _cluster_distance(a: ClusterNode, b: ClusterNode) -> float:
+    """
+    Computes the distance between the bounding boxes of two clusters.
+
+    Args:
+        a: First cluster.
+        b: Second cluster.
+
+    Returns:
+        float: Euclidean box-to-box distance (0 if the boxes overlap).
+    """
+    gap = np.maximum(0.0, np.maximum(a.bbox_min - b.bbox_max, b.bbox_min - a.bbox_max))
+    return float(np.linalg.norm(gap))
+
+
+def _aca(
+    row_func: Callable[[int], np.ndarray],
+    col_func: Callable[[int], np.ndarray],
+    nrows: int,
+    ncols: int,
+    eps: float,
+    max_rank: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Adaptive Cross Approximation with partial pivoting.
+
+    Approximates a block as U @ V from a handful of its rows and columns,
+    stopping when the rank-1 update falls below eps relative to the
+    running Frobenius-norm estimate of the approximant.
+
+    Args:
+        row_func: Callable returning row i of the block, shape (ncols,).
+        col_func: Callable returning column j of the block, shape (nrows,).
+        nrows: Number of rows of the block.
+        ncols: Number of columns of the block.
+        eps: Relative accuracy target.
+        max_rank: Hard cap on the approximation rank.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Factors U (nrows, k) and V (k, ncols).
+    """
+    us: List[np.ndarray] = []
+    vs: List[np.ndarray] = []
+    unused = np.ones(nrows, dtype=bool)
+    i = 0
+    frob2 = 0.0
+
+    while len(us) < max_rank and unused.any():
+        row = row_func(i).astype(np.float64, copy=True)
+        for u, v in zip(us, vs):
+            row -= u[i] * v
+        unused[i] = False
+
+        j = int(np.argmax(np.abs(row)))
+        pivot = row[j]
+        if abs(pivot) < 1e-300:
+            # Degenerate pivot row: move on to the next unused one
+            i = int(np.argmax(unused))
+            continue
+
+        v = row / pivot
+        col = col_func(j).astype(np.float64, copy=True)
+        for u, w in zip(us, vs):
+            col -= w[j] * u
+        u = col
+
+        # Update the Frobenius-norm estimate of the approximant
+        u2, v2 = float(u @ u), float(v @ v)
+        cross = sum(float(u @ us[k]) * float(v @ vs[k]) for k in range(len(us)))
+        frob2 += u2 * v2 + 2.0 * cross
+
+        us.append(u)
+        vs.append(v)
+
+        if u2 * v2 <= eps**2 * frob2:
+            break
+
+        # Next pivot row: largest residual entry of the new column
+        masked = np.where(unused, np.abs(u), -1.0)
+        i = int(np.argmax(masked))
+
+    U = np.stack(us, axis=1) if us else np.zeros((nrows, 0))
+    V = np.stack(vs, axis=0) if vs else np.zeros((0, ncols))
+    return U, V
+
+
+class HMatrix:
+    """
+    Hierarchical (data-sparse) approximation of a dense BEM matrix.
+
+    Far-field cluster pairs are compressed with low-rank ACA factors,
+    near-field pairs are stored dense, giving O(N log N)-ish storage and
+    matvec cost instead of O(N^2). Intended for use with an iterative
+    solver (e.g. GMRES) through `matvec`.
+    """
+
+    def __init__(
+        self,
+        block_func: BlockFunc,
+        centers: np.ndarray,
+        eps: float = 1e-4,
+        eta: float = 1.0,
+        leaf_size: int = 32,
+        max_rank: int = 64,
+    ):
+        """
+        Builds the block partition and compresses admissible blocks.
+
+        Args:
+            block_func: Evaluator for (source, field) element index sets.
+            centers: (N, 2) element center coordinates.
+            eps: Relative ACA accuracy for admissible blocks.
+            eta: Admissibility parameter; a pair is compressed when
+                max(diam) <= eta * dist between the cluster boxes.
+            leaf_size: Maximum number of elements in a leaf cluster.
+            max_rank: Hard cap on the ACA rank per block.
+        """
+        self.M = len(centers)
+        self.shape = (2 * self.M, 2 * self.M)
+        self.eps = eps
+        self.eta = eta
+        self.max_rank = max_rank
+        self._block_func = block_func
+
+        # Block list entries: (row_dofs, col_dofs, U, V) with V=None for dense
+        self.blocks: List[
+            Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]
+        ] = []
+        # Optional per-element 2x2 diagonal correction (rigid-body trick)
+        self.diag_blocks: Optional[np.ndarray] = None
+
+        root = ClusterNode(np.arange(self.M, dtype=np.intp), centers, leaf_size)
+        self._build(root, root)
+
+    @staticmethod
+    def _dofs(idx: np.ndarray) -> np.ndarray:
+        """
+        Expands element indices to interleaved (x, y) DOF indices.
+
+        Args:
+            idx: Element index array.
+
+        Returns:
+            np.ndarray: DOF index array of length 2 * len(idx).
+        """
+        return np.stack([2 * idx, 2 * idx + 1], axis=1).ravel()
+
+    def _build(self, src: ClusterNode, fld: ClusterNode):
+        """Recursively partitions a cluster pair into admissible/dense blocks.
+
+        Args:
+            src: Source (row) cluster.
+            fld: Field (column) cluster.
+        """
+        dist = _cluster_distance(src, fld)
+
+        if dist > 0.0 and max(src.diameter, fld.diameter) <= self.eta * dist:
+            self._add_lowrank(src.indices, fld.indices)
+        elif not src.children and not fld.children:
+            block = self._block_func(src.indices, fld.indices)
+            self.blocks.append(
+                (self._dofs(src.indices), self._dofs(fld.indices), block, None)
+            )
+        else:
+            src_kids = src.children or [src]
+            fld_kids = fld.children or [fld]
+            for s in src_kids:
+                for f in fld_kids:
+                    self._build(s, f)
+
+    def _add_lowrank(self, src_idx: np.ndarray, fld_idx: np.ndarray):
+        """Compresses one admissible block with ACA and stores its factors.
+
+        Args:
+            src_idx: Source element indices of the block.
+            fld_idx: Field element indices of the block.
+        """
+        nrows, ncols = 2 * len(src_idx), 2 * len(fld_idx)
+
+        def row_func(i: int) -> np.ndarray:
+            rows = self._block_func(src_idx[i // 2 : i // 2 + 1], fld_idx)
+            return rows[i % 2]
+
+        def col_func(j: int) -> np.ndarray:
+            cols = self._block_func(src_idx, fld_idx[j // 2 : j // 2 + 1])
+            return cols[:, j % 2]
+
+        U, V = _aca(row_func, col_func, nrows, ncols, self.eps, self.max_rank)
+        self.blocks.append((self._dofs(src_idx), self._dofs(fld_idx), U, V))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """
+        Applies the compressed matrix to a vector.
+
+        Args:
+            x: Input vector of length 2N.
+
+        Returns:
+            np.ndarray: The product A @ x.
+        """
+        y = np.zeros_like(x, dtype=np.float64)
+        for row_dofs, col_dofs, U, V in self.blocks:
+            xs = x[col_dofs]
+            if V is None:
+                y[row_dofs] += U @ xs
+            else:
+                y[row_dofs] += U @ (V @ xs)
+
+        if self.diag_blocks is not None:
+            y += np.einsum("mij,mj->mi", self.diag_blocks, x.reshape(-1, 2)).ravel()
+
+        return y
+
+    def set_rigid_body_diagonal(self):
+        """Installs the rigid-body diagonal correction used for the H matrix.
+
+        The assembled traction blocks carry zero 2x2 self-blocks (CPV); the
+        true diagonal is recovered as minus the row sum over all other
+        elements, computed here with two matvecs against the unit x/y
+        column patterns so H * 1 = 0 holds for the compressed operator.
+        """
+        ex = np.zeros(self.shape[1])
+        ey = np.zeros(self.shape[1])
+        ex[0::2] = 1.0
+        ey[1::2] = 1.0
+
+        sx = self.matvec(ex)
+        sy = self.matvec(ey)
+
+        D = np.empty((self.M, 2, 2))
+        D[:, 0, 0] = -sx[0::2]
+        D[:, 1, 0] = -sx[1::2]
+        D[:, 0, 1] = -sy[0::2]
+        D[:, 1, 1] = -sy[1::2]
+        self.diag_blocks = D
+
+    def memory_compression(self) -> float:
+        """
+        Computes the stored-entry count relative to the dense matrix.
+
+        Returns:
+            float: Stored entries divided by (2N)^2.
+        """
+        stored = 0
+        for _, _, U, V in self.blocks:
+            stored += U.size + (V.size if V is not None else 0)
+        if self.diag_blocks is not None:
+            stored += self.diag_blocks.size
+        return stored / (self.shape[0] * self.shape[1])
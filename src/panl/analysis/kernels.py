@@ -2,6 +2,98 @@ import numpy as np
 
 from .material import OrthotropicMaterial
 
+try:  # Optional accelerator; the solver falls back to NumPy broadcasting
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+    prange = range
+
+
+def _integrate_segments(
+    src_idx: np.ndarray,
+    fld_idx: np.ndarray,
+    centers: np.ndarray,
+    p1s: np.ndarray,
+    p2s: np.ndarray,
+    normals: np.ndarray,
+    mu1: complex,
+    mu2: complex,
+):
+    """
+    Evaluates the segment integrals for all (source, field) element pairs.
+
+    Free function on raw contiguous arrays so it can be JIT-compiled; the
+    math matches BEMSolver._integrate_kernels. Singular (self) pairs carry
+    zero in the 1/z integrals (CPV of the traction kernel).
+
+    Args:
+        src_idx: Global indices of the source (collocation) elements.
+        fld_idx: Global indices of the field elements.
+        centers: (N, 2) element center coordinates.
+        p1s: (N, 2) element start points.
+        p2s: (N, 2) element end points.
+        normals: (N, 2) outward unit normals.
+        mu1: First characteristic root of the material.
+        mu2: Second characteristic root of the material.
+
+    Returns:
+        Tuple of four (m, n) complex arrays: the log-z integrals
+        (di11, di12) and the 1/z integrals (di21, di22).
+    """
+    m = src_idx.shape[0]
+    n = fld_idx.shape[0]
+    di11 = np.empty((m, n), dtype=np.complex128)
+    di12 = np.empty((m, n), dtype=np.complex128)
+    di21 = np.empty((m, n), dtype=np.complex128)
+    di22 = np.empty((m, n), dtype=np.complex128)
+
+    # Rows are independent; prange spreads them across cores when compiled.
+    # Work per row is uniform (same n field elements), so numba's default
+    # static chunking balances well.
+    for a in prange(m):
+        i = src_idx[a]
+        cx, cy = centers[i, 0], centers[i, 1]
+
+        for b in range(n):
+            j = fld_idx[b]
+            # Straight-segment specialization: the unit normal gives the
+            # panel angle exactly (cos(alpha) = nx, sin(alpha) = ny), so
+            # no arctan2/cos/sin round-trip is needed.
+            nx, ny = normals[j, 0], normals[j, 1]
+            den1 = mu1 * nx - ny
+            den2 = mu2 * nx - ny
+
+            p1x, p1y = p1s[j, 0] - cx, p1s[j, 1] - cy
+            p2x, p2y = p2s[j, 0] - cx, p2s[j, 1] - cy
+
+            z1_1 = p1x + mu1 * p1y
+            z1_2 = p2x + mu1 * p2y
+            z2_1 = p1x + mu2 * p1y
+            z2_2 = p2x + mu2 * p2y
+
+            dln1 = np.log(z1_2 / z1_1)
+            dln2 = np.log(z2_2 / z2_1)
+
+            di11[a, b] = ((z1_2 - z1_1) * (np.log(z1_1) - 1.0) + z1_2 * dln1) / den1
+            di12[a, b] = ((z2_2 - z2_1) * (np.log(z2_1) - 1.0) + z2_2 * dln2) / den2
+
+            if i == j:
+                di21[a, b] = 0.0
+                di22[a, b] = 0.0
+            else:
+                di21[a, b] = dln1 / den1
+                di22[a, b] = dln2 / den2
+
+    return di11, di12, di21, di22
+
+
+if HAVE_NUMBA:
+    integrate_segments = njit(cache=True, parallel=True)(_integrate_segments)
+else:
+    integrate_segments = _integrate_segments
+
 
 class BEMKernels:
     """
@@ -13,6 +105,8 @@ class BEMKernels:
         self.mat = material
         self.mu1 = material.mu1
         self.mu2 = material.mu2
+        # Shared reference to the material's cached stiffness matrix
+        self.C = material.C
 
         # Calculate p_k, q_k (Eq 16)
         b = material.beta
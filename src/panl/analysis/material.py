@@ -144,7 +144,10 @@ class OrthotropicMaterial:
         """
         Returns the constitutive matrix [C] = [S]^-1.
 
+        The inverse is computed once in __init__ and shared; callers get
+        the cached array rather than a fresh inversion.
+
         Returns:
             np.ndarray: Stiffness matrix.
         """
-        return np.linalg.inv(self.beta)
+        return self.C
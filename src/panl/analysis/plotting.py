@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -17,6 +17,7 @@ def plot_results(
     show_labels: bool = True,
     title: Optional[str] = None,
     save_path: Optional[str] = None,
+    grid: Optional[Tuple[int, int]] = None,
 ) -> plt.Figure:
     """
     Plots the panel geometry, mesh, and results.
@@ -31,20 +32,28 @@ def plot_results(
         show_labels: Whether to highlight and label max stress points.
         title: Optional title for the plot.
         save_path: Optional path to save the figure to.
+        grid: Optional (nx, ny) resolution for an interior stress-field
+            image. The nx*ny evaluation points go through a single batched
+            compute_stress call rather than a per-pixel Python loop, so the
+            resolution is decoupled from the figure size.
 
     Returns:
         plt.Figure: The generated figure.
     """
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    # 1. Draw Geometry and Mesh
+    # 1. Interior stress field (optional, drawn under the boundary)
+    if grid is not None:
+        _draw_stress_field(fig, ax, solver, u_boundary, t_boundary, stress_type, grid)
+
+    # 2. Draw Geometry and Mesh
     _draw_boundary(ax, solver.elements, u_boundary, deform_scale, show_mesh)
 
-    # 2. Highlight Max Stress Points
+    # 3. Highlight Max Stress Points
     if show_labels:
         _highlight_max_stresses(ax, solver, u_boundary, t_boundary, stress_type)
 
-    # 3. Aesthetics
+    # 4. Aesthetics
     ax.set_aspect("equal")
     ax.set_xlabel("X")
     ax.set_ylabel("Y")
@@ -116,6 +125,94 @@ def _draw_boundary(
                 ax.plot(c_def[0], c_def[1], "r.", markersize=4)
 
 
+def _stress_scalar(sxx, syy, txy, stress_type: str):
+    """Reduces stress components to the requested scalar measure.
+
+    Works elementwise on scalars or arrays.
+
+    Args:
+        sxx: Normal stress in x.
+        syy: Normal stress in y.
+        txy: Shear stress.
+        stress_type: Type of stress to evaluate (vm, xx, yy, xy, principal).
+
+    Returns:
+        Tuple of (value, label) where value matches the input shape.
+
+    Raises:
+        ValueError: If stress_type is not recognized.
+    """
+    kind = stress_type.lower()
+    if kind == "vm":
+        return np.sqrt(sxx**2 - sxx * syy + syy**2 + 3 * txy**2), "Max VM"
+    elif kind == "xx":
+        return sxx, "Max σxx"
+    elif kind == "yy":
+        return syy, "Max σyy"
+    elif kind == "xy":
+        return np.abs(txy), "Max |τxy|"
+    elif kind == "principal":
+        return (sxx + syy) / 2 + np.sqrt(((sxx - syy) / 2) ** 2 + txy**2), "Max P1"
+    else:
+        raise ValueError(f"Unknown stress_type: {stress_type}")
+
+
+def _draw_stress_field(
+    fig: plt.Figure,
+    ax: plt.Axes,
+    solver: BEMSolver,
+    u_boundary: np.ndarray,
+    t_boundary: np.ndarray,
+    stress_type: str,
+    grid: Tuple[int, int],
+):
+    """Renders the interior stress field on a downsampled grid.
+
+    Evaluation points sit at pixel centers (never on the boundary itself,
+    where the kernels are singular) and go through one batched
+    compute_stress call. Pixels inside cutouts are masked out.
+
+    Args:
+        fig: Matplotlib figure (for the colorbar).
+        ax: Matplotlib axes object.
+        solver: The BEM solver instance.
+        u_boundary: Solved boundary displacements.
+        t_boundary: Solved boundary tractions.
+        stress_type: Type of stress to evaluate (vm, xx, yy, xy, principal).
+        grid: (nx, ny) grid resolution.
+    """
+    nx, ny = grid
+    W, H = solver.geom.width, solver.geom.height
+
+    # Pixel-center coordinates: edges span [0, W] x [0, H], samples sit
+    # half a pixel inside, so no point lands on the singular boundary.
+    xe = np.linspace(0.0, W, nx + 1)
+    ye = np.linspace(0.0, H, ny + 1)
+    xc = 0.5 * (xe[:-1] + xe[1:])
+    yc = 0.5 * (ye[:-1] + ye[1:])
+    pts = np.stack(np.meshgrid(xc, yc), axis=-1).reshape(-1, 2)
+
+    inside = np.zeros(pts.shape[0], dtype=bool)
+    for cutout in solver.geom.cutouts:
+        inside |= cutout.contains(pts)
+
+    stresses = solver.compute_stress(pts[~inside], u_boundary, t_boundary)
+    vals, _ = _stress_scalar(
+        stresses[:, 0], stresses[:, 1], stresses[:, 2], stress_type
+    )
+    vals_flat = np.full(pts.shape[0], np.nan)
+    vals_flat[~inside] = vals
+
+    im = ax.imshow(
+        vals_flat.reshape(ny, nx),
+        origin="lower",
+        extent=(0.0, W, 0.0, H),
+        cmap="viridis",
+        interpolation="bilinear",
+    )
+    fig.colorbar(im, ax=ax, shrink=0.8, label=f"sigma ({stress_type})")
+
+
 def _highlight_max_stresses(
     ax: plt.Axes,
     solver: BEMSolver,
@@ -131,9 +228,6 @@ def _highlight_max_stresses(
         u_boundary: Solved boundary displacements.
         t_boundary: Solved boundary tractions.
         stress_type: Type of stress to evaluate (vm, xx, yy, xy, principal).
-
-    Raises:
-        ValueError: If stress_type is not recognized.
     """
     # Find elements that likely belong to cutouts.
     # Better: use tagging if available. For now, check all.
@@ -146,25 +240,7 @@ def _highlight_max_stresses(
     for i, el in enumerate(solver.elements):
         if el.tag == "cutout":
             sxx, syy, txy = boundary_stresses[i]
-
-            if stress_type.lower() == "vm":
-                val = np.sqrt(sxx**2 - sxx * syy + syy**2 + 3 * txy**2)
-                label = "Max VM"
-            elif stress_type.lower() == "xx":
-                val = sxx
-                label = "Max σxx"
-            elif stress_type.lower() == "yy":
-                val = syy
-                label = "Max σyy"
-            elif stress_type.lower() == "xy":
-                val = abs(txy)
-                label = "Max |τxy|"
-            elif stress_type.lower() == "principal":
-                val = (sxx + syy) / 2 + np.sqrt(((sxx - syy) / 2) ** 2 + txy**2)
-                label = "Max P1"
-            else:
-                raise ValueError(f"Unknown stress_type: {stress_type}")
-
+            val, label = _stress_scalar(sxx, syy, txy, stress_type)
             stress_values.append(val)
             points.append(el.center)
 
@@ -1,9 +1,12 @@
-from typing import Tuple
+import hashlib
+from pathlib import Path
+from typing import Optional, Tuple
 
 import numpy as np
 
 from panl.analysis.geometry import BoundaryElement, PanelGeometry
-from panl.analysis.kernels import BEMKernels
+from panl.analysis.hmatrix import HMatrix
+from panl.analysis.kernels import HAVE_NUMBA, BEMKernels, integrate_segments
 
 
 class BEMSolver:
@@ -11,23 +14,79 @@ class BEMSolver:
     Boundary Element Method solver for anisotropic elasticity.
     """
 
-    def __init__(self, kernels: BEMKernels, geom: PanelGeometry):
+    def __init__(
+        self,
+        kernels: BEMKernels,
+        geom: PanelGeometry,
+        backend: str = "numpy",
+        method: str = "dense",
+        eps: float = 1e-4,
+        dtype: np.dtype = np.float64,
+    ):
         """
         Initializes the BEM solver.
 
         Args:
             kernels: BEM kernels for the material.
             geom: The panel geometry being analyzed.
+            backend: Array backend for assembly: "numpy" (default) or
+                "cuda" (requires CuPy; matrices are copied back to host).
+            method: "dense" (default) assembles full H/G matrices and uses
+                a direct solve; "hmatrix" builds ACA-compressed operators
+                and solves iteratively with GMRES; "matrix_free" fuses
+                assembly with the matvec, regenerating kernel blocks
+                row-chunk by row-chunk inside GMRES so nothing of size
+                N x N is ever stored.
+            eps: Relative accuracy of the H-matrix compression. Ignored
+                for the dense method.
+            dtype: Precision of the stored dense matrices and the direct
+                solve, np.float64 (default) or np.float32. Single
+                precision halves the memory traffic of the dense system
+                and is plenty for few-digit SCF work. Ignored for the
+                hmatrix method.
+
+        Raises:
+            ValueError: If backend, method, or dtype is not recognized.
         """
+        if backend not in ("numpy", "cuda"):
+            raise ValueError(f"Unknown backend: {backend}")
+        if method not in ("dense", "hmatrix", "matrix_free"):
+            raise ValueError(f"Unknown method: {method}")
+        if np.dtype(dtype) not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        self.backend = backend
+        self.method = method
+        self.eps = eps
+        self.dtype = np.dtype(dtype)
         self.kernels = kernels
         self.geom = geom
         self.elements = geom.elements
         self.num_elements = len(self.elements)
         self.M = self.num_elements
 
-        # System matrices
-        self.H = np.zeros((2 * self.M, 2 * self.M))
-        self.G = np.zeros((2 * self.M, 2 * self.M))
+        # Struct-of-arrays mesh buffers from the geometry
+        self.centers = geom.centers
+        self.normals = geom.normals
+        self.lengths = geom.lengths
+        self.p1s = np.array([el.p1 for el in self.elements])
+        self.p2s = np.array([el.p2 for el in self.elements])
+        # Unit tangents follow the discretization direction; for straight
+        # elements they come from the normals exactly: (tx, ty) = (-ny, nx).
+        self.tangents = np.column_stack((-self.normals[:, 1], self.normals[:, 0]))
+        self.tags = np.array([el.tag for el in self.elements])
+
+        # System matrices (dense method only; the compressed and
+        # matrix-free methods never materialize anything of size N x N)
+        if method == "dense":
+            self.H = np.zeros((2 * self.M, 2 * self.M), dtype=self.dtype)
+            self.G = np.zeros((2 * self.M, 2 * self.M), dtype=self.dtype)
+
+        # Cached LU factorization of the mixed system (keyed by bc_type)
+        self._lu = None
+        self._lu_key = None
+
+        # Rigid-body diagonal blocks for the matrix-free operator
+        self._h_diag = None
 
         # Solve for coefficients p, q, A, mu from kernels
         self.mu1 = kernels.mu1
@@ -36,35 +95,290 @@ class BEMSolver:
         self.q1, self.q2 = kernels.q1, kernels.q2
         self.A = kernels.A  # A[i, k] where i load dir, k root index
 
-    def assemble(self):
-        """Assembles G and H matrices using constant elements."""
-        for i in range(self.M):  # Source element (collocation point at center)
-            Pi = self.elements[i].center
+    # Default location for cached assembled matrices
+    CACHE_DIR = Path.home() / ".cache" / "panelyze"
+
+    def _cache_key(self) -> str:
+        """
+        Builds a stable hash of the mesh and material defining H and G.
+
+        Returns:
+            str: Hex digest keying the assembled matrices.
+        """
+        mat = self.kernels.mat
+        h = hashlib.blake2b(digest_size=16)
+        for val in (mat.e1, mat.e2, mat.nu12, mat.g12, mat.theta, mat.thickness):
+            h.update(np.float64(val).tobytes())
+        h.update(self.centers.tobytes())
+        h.update(self.normals.tobytes())
+        h.update(self.lengths.tobytes())
+        h.update(self.dtype.str.encode())
+        return h.hexdigest()
+
+    def assemble(self, use_cache: bool = False, cache_dir: Optional[Path] = None):
+        """Assembles G and H matrices using constant elements.
+
+        Args:
+            use_cache: If True, memoize the assembled matrices on disk keyed
+                by a hash of the mesh and material, so repeated runs of the
+                same model skip the O(N^2) assembly entirely. Only applies
+                to the dense method.
+            cache_dir: Directory for the cached .npz files. Defaults to
+                ``~/.cache/panelyze``.
+        """
+        # New matrices invalidate any cached factorization
+        self._lu = None
+        self._lu_key = None
+
+        if self.method == "hmatrix":
+            self._assemble_hmatrix()
+            return
+
+        if self.method == "matrix_free":
+            self._assemble_matrix_free()
+            return
+
+        if use_cache:
+            cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+            cache_file = cache_dir / f"assembly_{self._cache_key()}.npz"
+            if cache_file.exists():
+                data = np.load(cache_file)
+                self.H = data["H"]
+                self.G = data["G"]
+                return
+
+        self._assemble_dense()
+
+        if use_cache:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            np.savez(cache_file, H=self.H, G=self.G)
+
+    def _assemble_hmatrix(self):
+        """Builds ACA-compressed H and G operators instead of dense matrices.
+
+        Elements are clustered geometrically; well-separated cluster pairs
+        are stored as low-rank ACA factors and near-field pairs dense. The
+        rigid-body diagonal of H is installed on the compressed operator.
+        """
+        self.Hop = HMatrix(
+            lambda s, f: self._kernel_blocks(s, f)[0], self.centers, eps=self.eps
+        )
+        self.Gop = HMatrix(
+            lambda s, f: self._kernel_blocks(s, f)[1], self.centers, eps=self.eps
+        )
+        self.Hop.set_rigid_body_diagonal()
+
+    # Source rows regenerated per sweep in the matrix-free matvec; the
+    # transient kernel block is (2 * chunk, 2 * N).
+    _row_chunk = 256
 
-            for j in range(self.M):  # Field element
-                el_j = self.elements[j]
+    def _assemble_matrix_free(self):
+        """Prepares the matrix-free operator; no matrices are stored.
 
-                # Compute integrals of U and T over el_j with source at Pi
-                du, dt = self._integrate_kernels(Pi, el_j, i == j)
+        Only the rigid-body diagonal blocks of H are precomputed (via two
+        unit-pattern sweeps, same trick as the compressed operator); every
+        matvec afterwards regenerates the kernel blocks on the fly.
+        """
+        M = self.M
+        self._h_diag = np.zeros((M, 2, 2))
+        pattern = np.zeros(2 * M)
+        for c in range(2):
+            pattern[:] = 0.0
+            pattern[c::2] = 1.0
+            y = self._matvec_HG(pattern, None)
+            self._h_diag[:, 0, c] = -y[0::2]
+            self._h_diag[:, 1, c] = -y[1::2]
+
+    def _matvec_HG(
+        self, xh: Optional[np.ndarray], xg: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Computes H @ xh - G @ xg in one fused assembly/multiply sweep.
+
+        Kernel blocks are generated one row-chunk at a time, multiplied
+        into the result, and discarded, so peak memory is O(chunk * N)
+        instead of O(N^2). Both products share a single kernel evaluation
+        per chunk. Pass None for xh or xg to skip that term.
+
+        Args:
+            xh: Vector multiplied by H, or None.
+            xg: Vector multiplied by G, or None.
+
+        Returns:
+            np.ndarray: The combined product, length 2 * M.
+        """
+        M = self.M
+        idx = np.arange(M)
+        y = np.empty(2 * M)
+        for start in range(0, M, self._row_chunk):
+            rows = idx[start : start + self._row_chunk]
+            Hb, Gb = self._kernel_blocks(rows, idx)
+            yc = Hb @ xh if xh is not None else 0.0
+            if xg is not None:
+                yc = yc - Gb @ xg
+            y[2 * start : 2 * start + 2 * len(rows)] = yc
+        if xh is not None and self._h_diag is not None:
+            y += np.einsum("mij,mj->mi", self._h_diag, xh.reshape(M, 2)).ravel()
+        return y
+
+    def apply(self, x: np.ndarray) -> np.ndarray:
+        """
+        Applies H to a boundary vector without materializing the matrix.
+
+        Args:
+            x: Vector of length 2 * M.
+
+        Returns:
+            np.ndarray: H @ x, including the rigid-body diagonal.
+        """
+        return self._matvec_HG(x, None)
 
-                # Fill matrices
-                # row indices: 2*i, 2*i+1 (x and y directions)
-                # col indices: 2*j, 2*j+1
-                # Fill matrices (Transposed due to reciprocity)
-                # Reciprocity: U_ji(P, Q) = U_ij(Q, P).
-                # My integrate(P, Q) gives response at Q due to load at P.
-                # So we transpose to get response at P due to condition at Q.
-                self.G[2 * i : 2 * i + 2, 2 * j : 2 * j + 2] = du.T
-                self.H[2 * i : 2 * i + 2, 2 * j : 2 * j + 2] = dt.T
+    def _get_array_module(self):
+        """
+        Resolves the array module for the configured backend.
+
+        Returns:
+            module: numpy, or cupy when backend="cuda".
+
+        Raises:
+            ImportError: If backend="cuda" but CuPy is not installed.
+        """
+        if self.backend == "cuda":
+            try:
+                import cupy
+            except ImportError as exc:
+                raise ImportError(
+                    "backend='cuda' requires CuPy (pip install cupy)."
+                ) from exc
+            return cupy
+        return np
+
+    def _kernel_blocks(
+        self, src_idx: np.ndarray, fld_idx: np.ndarray, xp=np
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluates the H and G sub-blocks for arbitrary element index sets.
+
+        The same integrals as `_integrate_kernels`, evaluated for every
+        (source, field) pair via broadcasting: each intermediate is an
+        (m, n) array indexed [source i, field j]. Singular (self) pairs
+        are zeroed in the traction kernel (CPV); the rigid-body diagonal
+        correction is applied separately by the caller.
+
+        Args:
+            src_idx: Global indices of the source (collocation) elements.
+            fld_idx: Global indices of the field elements.
+            xp: Array module to evaluate with (numpy or cupy).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (H_block, G_block), each of
+            shape (2 * len(src_idx), 2 * len(fld_idx)).
+        """
+        if xp is np and HAVE_NUMBA:
+            # JIT-compiled loop core over raw arrays
+            di11, di12, di21, di22 = integrate_segments(
+                np.ascontiguousarray(src_idx),
+                np.ascontiguousarray(fld_idx),
+                self.centers,
+                self.p1s,
+                self.p2s,
+                self.normals,
+                self.mu1,
+                self.mu2,
+            )
+            normals = self.normals[fld_idx]
+            nx, ny = normals[:, 0], normals[:, 1]
+        else:
+            centers = xp.asarray(self.centers[src_idx])
+            normals = xp.asarray(self.normals[fld_idx])
+            p1s = xp.asarray(self.p1s[fld_idx])
+            p2s = xp.asarray(self.p2s[fld_idx])
+
+            # Endpoints of field element j relative to source point i: (m, n, 2)
+            r1 = p1s[None, :, :] - centers[:, None, :]
+            r2 = p2s[None, :, :] - centers[:, None, :]
+
+            nx, ny = normals[:, 0], normals[:, 1]
+
+            # Complex coords z_k at endpoints, (m, n)
+            z1_1 = r1[..., 0] + self.mu1 * r1[..., 1]
+            z1_2 = r2[..., 0] + self.mu1 * r2[..., 1]
+            z2_1 = r1[..., 0] + self.mu2 * r1[..., 1]
+            z2_2 = r2[..., 0] + self.mu2 * r2[..., 1]
+
+            # Denominator term (mu_k * cos(alpha) - sin(alpha)); straight
+            # segments give cos(alpha) = nx and sin(alpha) = ny exactly
+            den1 = self.mu1 * nx - ny
+            den2 = self.mu2 * nx - ny
+
+            # Continuous change in log
+            dln1 = xp.log(z1_2 / z1_1)
+            dln2 = xp.log(z2_2 / z2_1)
+
+            # Integral of 1/z (Traction kernel derivative)
+            di21 = dln1 / den1
+            di22 = dln2 / den2
+
+            # Integral of log z (Displacement kernel)
+            di11 = ((z1_2 - z1_1) * (xp.log(z1_1) - 1.0) + z1_2 * dln1) / den1
+            di12 = ((z2_2 - z2_1) * (xp.log(z2_1) - 1.0) + z2_2 * dln2) / den2
+
+            # Singular T is 0 in CPV; singular U handled by the general formula
+            sing = xp.asarray(src_idx)[:, None] == xp.asarray(fld_idx)[None, :]
+            di21 = xp.where(sing, 0.0, di21)
+            di22 = xp.where(sing, 0.0, di22)
+
+        # Traction kernel coefficients (mu_k * nx - ny), per field element
+        t1 = self.mu1 * nx - ny
+        t2 = self.mu2 * nx - ny
+
+        P = np.array([[self.p1, self.p2], [self.q1, self.q2]])
+        Q = np.array([[self.mu1, self.mu2], [-1.0, -1.0]], dtype=complex)
+
+        Hb = xp.empty((2 * len(src_idx), 2 * len(fld_idx)))
+        Gb = xp.empty((2 * len(src_idx), 2 * len(fld_idx)))
+
+        # Fill matrices (transposed due to reciprocity):
+        # G[2i+r, 2j+c] = DU[c, r], H[2i+r, 2j+c] = DT[c, r]
+        # where r is load dir at the source, c the component at the field.
+        for r in range(2):  # load dir (x,y)
+            for c in range(2):  # component dir (x,y)
+                du = P[c, 0] * self.A[r, 0] * di11 + P[c, 1] * self.A[r, 1] * di12
+                dt = (
+                    Q[c, 0] * t1 * self.A[r, 0] * di21
+                    + Q[c, 1] * t2 * self.A[r, 1] * di22
+                )
+                Gb[r::2, c::2] = 2.0 * du.real
+                Hb[r::2, c::2] = 2.0 * dt.real
+
+        return Hb, Gb
+
+    def _assemble_dense(self):
+        """Fills H and G by integrating over all element pairs at once.
+
+        With backend="cuda" the identical expressions run on device through
+        CuPy and the assembled matrices are copied back to host.
+        """
+        xp = self._get_array_module()
+        M = self.M
+        idx = np.arange(M)
+
+        H, G = self._kernel_blocks(idx, idx, xp=xp)
 
         # Rigid-body sum trick for diagonal of H
         # This replaces the 0.5 jump term and ensures H * 1 = 0
-        for i in range(self.M):
-            h_diag = np.zeros((2, 2))
-            for k in range(self.M):
-                if i != k:
-                    h_diag += self.H[2 * i : 2 * i + 2, 2 * k : 2 * k + 2]
-            self.H[2 * i : 2 * i + 2, 2 * i : 2 * i + 2] = -h_diag
+        diag = xp.arange(M)
+        for r in range(2):
+            for c in range(2):
+                Hrc = H[r::2, c::2]
+                Hrc[diag, diag] = 0.0
+                Hrc[diag, diag] = -Hrc.sum(axis=1)
+
+        if xp is not np:
+            H, G = xp.asnumpy(H), xp.asnumpy(G)
+        # Integrals are evaluated in double; only storage is narrowed
+        self.H = H.astype(self.dtype, copy=False)
+        self.G = G.astype(self.dtype, copy=False)
 
     def _integrate_kernels(
         self, source_pt: np.ndarray, el: BoundaryElement, is_singular: bool
@@ -85,8 +399,6 @@ class BEMSolver:
         p2 = el.p2 - source_pt
 
         nx, ny = el.nx, el.ny
-        # Normal angle alpha
-        alpha = np.arctan2(ny, nx)
 
         # Complex coords z_k at endpoints
         z1_1 = p1[0] + self.mu1 * p1[1]
@@ -94,10 +406,11 @@ class BEMSolver:
         z2_1 = p1[0] + self.mu2 * p1[1]
         z2_2 = p2[0] + self.mu2 * p2[1]
 
-        # Denominator term (mu_k * cos(alpha) - sin(alpha))
-        # This matches the NASA doc where alpha is normal angle.
-        den1 = self.mu1 * np.cos(alpha) - np.sin(alpha)
-        den2 = self.mu2 * np.cos(alpha) - np.sin(alpha)
+        # Denominator term (mu_k * cos(alpha) - sin(alpha)) from the NASA
+        # doc, where alpha is the normal angle. For straight elements the
+        # unit normal supplies cos/sin(alpha) directly.
+        den1 = self.mu1 * nx - ny
+        den2 = self.mu2 * nx - ny
 
         # Robust integration using log-difference identity
         # integral(log z) = z(log z - 1)
@@ -190,58 +503,53 @@ class BEMSolver:
             bc_type = np.zeros(2 * self.M, dtype=int)
             bc_value = np.zeros(2 * self.M)
 
-            # Find outer boundary extent to identify edges and corners
-            outer_elements = [el for el in self.elements if el.tag == "outer"]
-            if not outer_elements:
+            # Edge membership was recorded at mesh generation time
+            lh = self.geom.left_idx
+            rh = self.geom.right_idx
+            bottom = self.geom.bottom_idx
+            top = self.geom.top_idx
+
+            if lh.size + rh.size + bottom.size + top.size == 0:
                 raise ValueError("No 'outer' tagged elements found for default BCs.")
 
-            x_coords = [el.center[0] for el in outer_elements]
-            y_coords = [el.center[1] for el in outer_elements]
-            min_x, max_x = min(x_coords), max(x_coords)
-            min_y, max_y = min(y_coords), max(y_coords)
+            centers = self.centers
+            outer_idx = np.concatenate([bottom, rh, top, lh])
+            outer_centers = centers[outer_idx]
+            min_x, max_x = outer_centers[:, 0].min(), outer_centers[:, 0].max()
+            min_y = outer_centers[:, 1].min()
 
             # 1. Apply Running Loads (Nastran CQUAD4 convention)
             # - qx: +X on RH edge, -X on LH edge
             # - qy: +Y on Top edge, -Y on Bottom edge
             # - qxy: +Y on RH, +X on Top, -Y on LH, -X on Bottom
-            for i, el in enumerate(self.elements):
-                if el.tag == "outer":
-                    # Tension X (qx)
-                    if np.isclose(el.center[0], min_x):
-                        bc_value[2 * i] -= qx
-                    if np.isclose(el.center[0], max_x):
-                        bc_value[2 * i] += qx
-
-                    # Tension Y (qy)
-                    if np.isclose(el.center[1], min_y):
-                        bc_value[2 * i + 1] -= qy
-                    if np.isclose(el.center[1], max_y):
-                        bc_value[2 * i + 1] += qy
-
-                    # Shear (qxy)
-                    if np.isclose(el.center[0], max_x):  # RH
-                        bc_value[2 * i + 1] += qxy
-                    if np.isclose(el.center[0], min_x):  # LH
-                        bc_value[2 * i + 1] -= qxy
-                    if np.isclose(el.center[1], max_y):  # Top
-                        bc_value[2 * i] += qxy
-                    if np.isclose(el.center[1], min_y):  # Bottom
-                        bc_value[2 * i] -= qxy
+            # Assign via the precomputed edge indices; no coordinate
+            # comparisons are needed.
+
+            bc_x = bc_value[0::2]
+            bc_y = bc_value[1::2]
+
+            # Tension X (qx)
+            bc_x[lh] -= qx
+            bc_x[rh] += qx
+
+            # Tension Y (qy)
+            bc_y[bottom] -= qy
+            bc_y[top] += qy
+
+            # Shear (qxy)
+            bc_y[rh] += qxy
+            bc_y[lh] -= qxy
+            bc_x[top] += qxy
+            bc_x[bottom] -= qxy
 
             # 2. Rigid-Body Motion (RBM) Suppression
             # Fix LL corner in X and Y, and LR corner in Y.
             # Use coordinate-based search to find elements closest to corners.
-            ll_idx = min(
-                range(self.M),
-                key=lambda i: np.linalg.norm(
-                    self.elements[i].center - np.array([min_x, min_y])
-                ),
+            ll_idx = int(
+                np.argmin(np.linalg.norm(centers - np.array([min_x, min_y]), axis=1))
             )
-            lr_idx = min(
-                range(self.M),
-                key=lambda i: np.linalg.norm(
-                    self.elements[i].center - np.array([max_x, min_y])
-                ),
+            lr_idx = int(
+                np.argmin(np.linalg.norm(centers - np.array([max_x, min_y]), axis=1))
             )
 
             # NOTE: We apply these as DISPLACEMENT constraints (u=0, v=0)
@@ -257,8 +565,6 @@ class BEMSolver:
             # For now, coordinate-based element pinning is the BEM standard for panels.
 
         size = 2 * self.M
-        A = np.zeros((size, size))
-        b = np.zeros(size)
 
         # Handle running loads vs stress
         # running_load = stress * thickness -> stress = running_load / thickness
@@ -277,15 +583,10 @@ class BEMSolver:
         # If t[k] given (bc_type=0): u[k] unknown.
         #    col k of A = H[:, k]. RHS += G[:, k] * t[k]
 
-        for k in range(size):
-            if bc_type[k] == 1:  # Displacement u[k] is GIVEN
-                A[:, k] = -self.G[:, k]
-                b -= self.H[:, k] * traction_values[k]
-            else:  # Traction t[k] is GIVEN
-                A[:, k] = self.H[:, k]
-                b += self.G[:, k] * traction_values[k]
-
-        x = np.linalg.solve(A, b)
+        if self.method in ("hmatrix", "matrix_free"):
+            x = self._solve_iterative(bc_type, traction_values)
+        else:
+            x = self._solve_direct(bc_type, traction_values)
 
         # Recover u and t
         u = np.zeros(size)
@@ -300,6 +601,106 @@ class BEMSolver:
 
         return u, t
 
+    def _solve_direct(
+        self, bc_type: np.ndarray, traction_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        Solves the mixed dense system, reusing the LU factors when possible.
+
+        The system matrix depends only on bc_type (which columns come from
+        H vs -G), so its LU factorization is cached and re-solves with the
+        same constraint pattern but different load values skip the O(N^3)
+        factorization and cost only a triangular backsubstitution.
+
+        Args:
+            bc_type: Array of 0 (traction known) or 1 (displacement known).
+            traction_values: Prescribed boundary values (already scaled).
+
+        Returns:
+            np.ndarray: Solution vector of the mixed unknowns.
+        """
+        from scipy.linalg import lu_factor, lu_solve
+
+        m_u = bc_type == 1  # displacement given: column from -G
+        m_t = ~m_u  # traction given: column from H
+
+        # b = G @ (t_known) - H @ (u_known), restricted to the given DOFs
+        b = self.G[:, m_t] @ traction_values[m_t]
+        b -= self.H[:, m_u] @ traction_values[m_u]
+        b = b.astype(self.dtype, copy=False)
+
+        key = bc_type.tobytes()
+        if self._lu is None or self._lu_key != key:
+            # Fortran order matches LAPACK's expectation, so getrf factors
+            # the buffer in place instead of transposing a copy first; the
+            # column-wise fill below is also contiguous in this layout.
+            A = np.empty((2 * self.M, 2 * self.M), dtype=self.dtype, order="F")
+            A[:, m_u] = -self.G[:, m_u]
+            A[:, m_t] = self.H[:, m_t]
+            self._lu = lu_factor(A, overwrite_a=True, check_finite=False)
+            self._lu_key = key
+
+        return lu_solve(self._lu, b, overwrite_b=True, check_finite=False)
+
+    def _solve_iterative(
+        self, bc_type: np.ndarray, traction_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        Solves the mixed BEM system with GMRES, never forming the matrix.
+
+        Columns come from H where tractions are prescribed and from -G
+        where displacements are. With method="hmatrix" one application
+        costs two compressed matvecs; with method="matrix_free" both
+        products come out of a single fused kernel sweep per application.
+
+        Args:
+            bc_type: Array of 0 (traction known) or 1 (displacement known).
+            traction_values: Prescribed boundary values (already scaled).
+
+        Returns:
+            np.ndarray: Solution vector of the mixed unknowns.
+
+        Raises:
+            RuntimeError: If GMRES does not converge.
+        """
+        from scipy.sparse.linalg import LinearOperator, gmres
+
+        size = 2 * self.M
+        m_t = bc_type == 0  # u unknown, column from H
+        m_u = ~m_t  # t unknown, column from -G
+
+        # G columns are softer than H columns by roughly the material
+        # compliance; scale the traction unknowns so the mixed system is
+        # well conditioned for the iteration.
+        scale = 1.0 / self.kernels.mat.beta[0, 0]
+
+        if self.method == "hmatrix":
+
+            def matvec_hg(xh: np.ndarray, xg: np.ndarray) -> np.ndarray:
+                return self.Hop.matvec(xh) - self.Gop.matvec(xg)
+
+        else:
+            matvec_hg = self._matvec_HG
+
+        def apply(x: np.ndarray) -> np.ndarray:
+            xh = np.where(m_t, x, 0.0)
+            xg = np.where(m_u, x, 0.0) * scale
+            return matvec_hg(xh, xg)
+
+        # b = G @ t_known - H @ u_known
+        b = -matvec_hg(
+            np.where(m_u, traction_values, 0.0), np.where(m_t, traction_values, 0.0)
+        )
+
+        A = LinearOperator((size, size), matvec=apply)
+        x, info = gmres(A, b, rtol=1e-10, atol=0.0, restart=200, maxiter=20)
+        if info != 0:
+            raise RuntimeError(f"GMRES failed to converge (info={info}).")
+
+        # Undo the column scaling on the traction unknowns
+        x[m_u] *= scale
+        return x
+
     def compute_displacement(
         self, points: np.ndarray, u_boundary: np.ndarray, t_boundary: np.ndarray
     ) -> np.ndarray:
@@ -352,21 +753,24 @@ class BEMSolver:
         Returns:
             np.ndarray: Array of stresses (N, 3).
         """
+        points = np.atleast_2d(points)
         N = points.shape[0]
         stresses = np.zeros((N, 3))  # sigma_xx, sigma_yy, tau_xy
+        C = self.kernels.C
 
-        for i in range(N):
-            P = points[i]
-            grad_u = self._compute_u_gradient(P, u_boundary, t_boundary)
+        # Chunk the evaluation points so the (P, M) kernel arrays stay
+        # bounded in memory for large plot grids.
+        chunk = 4096
+        for start in range(0, N, chunk):
+            pts = points[start : start + chunk]
+            grad = self._compute_u_gradients(pts, u_boundary, t_boundary)
 
-            exx = grad_u[0, 0]
-            eyy = grad_u[1, 1]
-            gxy = grad_u[0, 1] + grad_u[1, 0]
+            strains = np.empty((pts.shape[0], 3))
+            strains[:, 0] = grad[:, 0, 0]  # exx
+            strains[:, 1] = grad[:, 1, 1]  # eyy
+            strains[:, 2] = grad[:, 0, 1] + grad[:, 1, 0]  # gxy
 
-            C = self.kernels.mat.C
-            stresses[i, 0] = C[0, 0] * exx + C[0, 1] * eyy + C[0, 2] * gxy
-            stresses[i, 1] = C[1, 0] * exx + C[1, 1] * eyy + C[1, 2] * gxy
-            stresses[i, 2] = C[2, 0] * exx + C[2, 1] * eyy + C[2, 2] * gxy
+            stresses[start : start + chunk] = strains @ C.T
 
         return stresses
 
@@ -385,112 +789,65 @@ class BEMSolver:
             np.ndarray: Array of stresses (M, 3) at each element center.
         """
         M = self.num_elements
-        stresses = np.zeros((M, 3))
         thickness = self.kernels.mat.thickness
 
-        for i in range(M):
-            el = self.elements[i]
-            # Normal and tangent vectors
-            nx, ny = el.nx, el.ny
-            tx, ty = -ny, nx  # CCW tangent: (-ny, nx) if normal is (ny, -dx)/L?
-            # Wait, geometry.py says:
-            # self.nx = self.dy / self.length
-            # self.ny = -self.dx / self.length
-            # If (dx, dy) is (1, 0), nx=0, ny=-1 (Bottom edge: 0,0 to W,0).
-            # Normal is pointing OUT (down).
-            # Tangent should follow the discretization direction: (dx, dy)/L.
-            tx, ty = el.dx / el.length, el.dy / el.length
-
-            # 1. Local boundary tractions (in psi)
-            # t[2*i], t[2*i+1] are resultants [lb/in].
-            tx_val = t_boundary[2 * i] / thickness
-            ty_val = t_boundary[2 * i + 1] / thickness
-
-            # sigma_nn = t . n
-            s_nn = tx_val * nx + ty_val * ny
-            # tau_ns = t . s
-            tau_ns = tx_val * tx + ty_val * ty
-
-            # 2. Tangential strain epsilon_ss = du_s / ds
-            # Use adjacent elements for derivatives.
-            # This works best if elements are in a contiguous loop.
-            # Find neighbors with same tag
-            prev_idx = (i - 1) % M
-            next_idx = (i + 1) % M
-
-            # Simple check: are they actually neighbors?
-            # Check p2 of prev == p1 of current, etc.
-            if self.elements[prev_idx].tag != el.tag:
-                # Search forward for the start of this tag-block
-                k = i
-                while self.elements[(k - 1) % M].tag == el.tag:
-                    k = (k - 1) % M
-                prev_idx = k  # Boundary of the group, use forward diff?
-                # Better: use current element's endpoints if we had nodal values.
-                # For constant elements, we usually use central diff of centers.
-                # If we are at the end of a block, we use a one-sided diff or
-                # wrap if it's a cutout.
-
-            # Logic for contiguous loops (cutouts and open lines)
-            # For cutouts, wrapping % M is usually correct.
-            # For the outer boundary, it might be 4 separate lines.
-
-            u_p = u_boundary[2 * prev_idx : 2 * prev_idx + 2]
-            u_n = u_boundary[2 * next_idx : 2 * next_idx + 2]
-
-            # displacement in tangent direction
-            us_p = u_p[0] * tx + u_p[1] * ty
-            us_n = u_n[0] * tx + u_n[1] * ty
-
-            # ds between centers
-            ds_p = np.linalg.norm(el.center - self.elements[prev_idx].center)
-            ds_n = np.linalg.norm(el.center - self.elements[next_idx].center)
-
-            if ds_p > 2 * el.length or ds_n > 2 * el.length:
-                # Not neighbors, use one-sided or zero
-                eps_ss = 0.0
-            else:
-                eps_ss = (us_n - us_p) / (ds_p + ds_n)
-
-            # 3. Solve for sigma_ss using Hooke's Law for plane stress
-            # For isotropic: sigma_ss = E * eps_ss + nu * sigma_nn
-            # For anisotropic, it's more complex involving the beta matrix.
-            # sigma = C * epsilon
-            # In local (s, n) coords:
-            # [eps_ss, eps_nn, gamma_sn]^T = [beta_local] * [stress_local]^T
-            # eps_ss = beta_11' * s_ss + beta_12' * s_nn + beta_16' * tau_sn
-            # s_ss = (eps_ss - beta_12' * s_nn - beta_16' * tau_sn) / beta_11'
-
-            # For now, let's use the isotropic approximation for the local
-            # "stress-traction" coupling if the material is nearly isotropic.
-            # Proper way: rotate beta to local element frame.
-            beta = self.kernels.mat.beta
-            theta_el = np.arctan2(ty, tx)
-            # transform compliance to local frame (s is x', n is y')
-            c = np.cos(theta_el)
-            s = np.sin(theta_el)
-            T = np.array(
-                [
-                    [c**2, s**2, 2 * s * c],
-                    [s**2, c**2, -2 * s * c],
-                    [-s * c, s * c, c**2 - s**2],
-                ]
-            )
-            # beta_prime = T * beta * T_T
-            beta_p = T @ beta @ T.T
-
-            s_ss = (eps_ss - beta_p[0, 1] * s_nn - beta_p[0, 2] * tau_ns) / beta_p[0, 0]
-
-            # 4. Transform back to global (x, y)
-            # sigma_xx = s_ss*tx^2 + s_nn*nx^2 + 2*tau_ns*tx*nx
-            # sigma_yy = s_ss*ty^2 + s_nn*ny^2 + 2*tau_ns*ty*ny
-            # tau_xy = s_ss*tx*ty + s_nn*nx*ny + tau_ns*(tx*ny + ty*nx)
-
-            stresses[i, 0] = s_ss * tx**2 + s_nn * nx**2 + 2 * tau_ns * tx * nx
-            stresses[i, 1] = s_ss * ty**2 + s_nn * ny**2 + 2 * tau_ns * ty * ny
-            stresses[i, 2] = (
-                s_ss * tx * ty + s_nn * nx * ny + tau_ns * (tx * ny + ty * nx)
-            )
+        # All per-element geometry comes from the contiguous buffers hoisted
+        # in __init__ (normals, tangents, centers, lengths); no attribute
+        # access on the element objects in this path.
+        nx, ny = self.normals[:, 0], self.normals[:, 1]
+        tx, ty = self.tangents[:, 0], self.tangents[:, 1]
+
+        # 1. Local boundary tractions (in psi)
+        # t[2*i], t[2*i+1] are resultants [lb/in].
+        tvals = t_boundary.reshape(M, 2) / thickness
+        s_nn = tvals[:, 0] * nx + tvals[:, 1] * ny  # sigma_nn = t . n
+        tau_ns = tvals[:, 0] * tx + tvals[:, 1] * ty  # tau_ns = t . s
+
+        # 2. Tangential strain epsilon_ss = du_s / ds via central difference
+        # of the neighboring element centers. Neighbors wrap within a
+        # tag-block: where the previous element belongs to a different loop
+        # (outer/cutout junction), fall back to a forward difference.
+        idx = np.arange(M)
+        prev_idx = np.where(self.tags[idx - 1] == self.tags, idx - 1, idx) % M
+        next_idx = (idx + 1) % M
+
+        u2d = u_boundary.reshape(M, 2)
+        us_p = u2d[prev_idx, 0] * tx + u2d[prev_idx, 1] * ty
+        us_n = u2d[next_idx, 0] * tx + u2d[next_idx, 1] * ty
+
+        ds_p = np.linalg.norm(self.centers - self.centers[prev_idx], axis=1)
+        ds_n = np.linalg.norm(self.centers - self.centers[next_idx], axis=1)
+
+        # Where the wrapped "neighbor" is actually far away (end of an open
+        # run), the difference is meaningless; zero the strain there.
+        far = (ds_p > 2 * self.lengths) | (ds_n > 2 * self.lengths)
+        eps_ss = np.where(far, 0.0, (us_n - us_p) / np.where(far, 1.0, ds_p + ds_n))
+
+        # 3. Solve for sigma_ss using Hooke's Law for plane stress.
+        # In local (s, n) coords:
+        # eps_ss = beta_11' * s_ss + beta_12' * s_nn + beta_16' * tau_sn
+        # s_ss = (eps_ss - beta_12' * s_nn - beta_16' * tau_sn) / beta_11'
+        # where beta' = T beta T^T rotates the compliance into the element
+        # frame. Only row 0 of beta' is needed; the unit tangent supplies
+        # cos/sin of the element angle exactly.
+        beta = self.kernels.mat.beta
+        c, s = tx, ty
+        row0 = np.stack([c**2, s**2, 2 * s * c], axis=1)  # (M, 3)
+        row1 = np.stack([s**2, c**2, -2 * s * c], axis=1)
+        row2 = np.stack([-s * c, s * c, c**2 - s**2], axis=1)
+
+        g = row0 @ beta  # (M, 3) = T[0, :] @ beta per element
+        b00 = np.sum(g * row0, axis=1)
+        b01 = np.sum(g * row1, axis=1)
+        b02 = np.sum(g * row2, axis=1)
+
+        s_ss = (eps_ss - b01 * s_nn - b02 * tau_ns) / b00
+
+        # 4. Transform back to global (x, y)
+        stresses = np.empty((M, 3))
+        stresses[:, 0] = s_ss * tx**2 + s_nn * nx**2 + 2 * tau_ns * tx * nx
+        stresses[:, 1] = s_ss * ty**2 + s_nn * ny**2 + 2 * tau_ns * ty * ny
+        stresses[:, 2] = s_ss * tx * ty + s_nn * nx * ny + tau_ns * (tx * ny + ty * nx)
 
         return stresses
 
@@ -546,83 +903,73 @@ class BEMSolver:
         h = self.kernels.mat.thickness
         return stresses * h
 
-    def _compute_u_gradient(
-        self, P: np.ndarray, u_boundary: np.ndarray, t_boundary: np.ndarray
+    def _compute_u_gradients(
+        self, points: np.ndarray, u_boundary: np.ndarray, t_boundary: np.ndarray
     ) -> np.ndarray:
         """
-        Computes the displacement gradient matrix du_i/dx_j at point P.
+        Computes displacement gradients du_i/dx_j for a batch of points.
+
+        All (point, element) kernel integrals are evaluated at once via
+        broadcasting and contracted against the boundary solution with
+        einsum, instead of looping point-by-point and element-by-element.
 
         Args:
-            P: The interior point (x, y) where the gradient is computed.
+            points: (P, 2) array of interior points.
             u_boundary: Solved boundary displacements.
             t_boundary: Solved boundary tractions.
 
         Returns:
-            np.ndarray: The 2x2 displacement gradient matrix.
+            np.ndarray: (P, 2, 2) array where [p, j, k] = du_j/dx_k.
         """
-        grad = np.zeros((2, 2))  # grad[i, j] = du_i/dx_j
-
-        for m in range(self.M):
-            el = self.elements[m]
-            nx, ny = el.nx, el.ny
-            alpha = np.arctan2(ny, nx)
-
-            p1 = el.p1 - P
-            p2 = el.p2 - P
-
-            z1_1 = p1[0] + self.mu1 * p1[1]
-            z1_2 = p2[0] + self.mu1 * p2[1]
-            z2_1 = p1[0] + self.mu2 * p1[1]
-            z2_2 = p2[0] + self.mu2 * p2[1]
-
-            den1 = self.mu1 * np.cos(alpha) - np.sin(alpha)
-            den2 = self.mu2 * np.cos(alpha) - np.sin(alpha)
-
-            # Integrals for gradients:
-            dln1 = np.log(z1_2 / z1_1)
-            dln2 = np.log(z2_2 / z2_1)
-
-            di21 = dln1 / den1
-            di22 = dln2 / den2
+        # Endpoints of element m relative to point p: (P, M, 2)
+        r1 = self.p1s[None, :, :] - points[:, None, :]
+        r2 = self.p2s[None, :, :] - points[:, None, :]
+
+        nx, ny = self.normals[:, 0], self.normals[:, 1]
+
+        z1_1 = r1[..., 0] + self.mu1 * r1[..., 1]
+        z1_2 = r2[..., 0] + self.mu1 * r2[..., 1]
+        z2_1 = r1[..., 0] + self.mu2 * r1[..., 1]
+        z2_2 = r2[..., 0] + self.mu2 * r2[..., 1]
+
+        # Straight elements: cos(alpha) = nx, sin(alpha) = ny exactly
+        den1 = self.mu1 * nx - ny
+        den2 = self.mu2 * nx - ny
+
+        # Integrals for gradients, (P, M)
+        di21 = np.log(z1_2 / z1_1) / den1
+        di22 = np.log(z2_2 / z2_1) / den2
+        di31 = (1.0 / z1_2 - 1.0 / z1_1) / den1
+        di32 = (1.0 / z2_2 - 1.0 / z2_1) / den2
+
+        P_mat = np.array([[self.p1, self.p2], [self.q1, self.q2]])
+        Q_mat = np.array([[self.mu1, self.mu2], [-1.0, -1.0]], dtype=complex)
+
+        # d/dx_k picks up a factor 1 (k=x) or mu (k=y) per root
+        gz1 = np.array([1.0, self.mu1])
+        gz2 = np.array([1.0, self.mu2])
+
+        # Coefficient tensors [load i, component j, derivative k] per root
+        c1 = np.einsum("i,j,k->ijk", P_mat[:, 0], self.A[:, 0], gz1)
+        c2 = np.einsum("i,j,k->ijk", P_mat[:, 1], self.A[:, 1], gz2)
+        d1 = np.einsum("i,j,k->ijk", Q_mat[:, 0], self.A[:, 0], gz1)
+        d2 = np.einsum("i,j,k->ijk", Q_mat[:, 1], self.A[:, 1], gz2)
+
+        t2d = t_boundary.reshape(self.M, 2)
+        u2d = u_boundary.reshape(self.M, 2)
+
+        # Traction kernel carries the per-element factor (mu_k * nx - ny)
+        t1 = self.mu1 * nx - ny
+        t2 = self.mu2 * nx - ny
+
+        # dG_ji,k contribution (transposed for reciprocity, see the
+        # dense-assembly comments): -2 Re { ... } * t
+        val_g = np.einsum("pm,mi,ijk->pjk", di21, t2d, c1) + np.einsum(
+            "pm,mi,ijk->pjk", di22, t2d, c2
+        )
+        # dH_ji,k contribution: +2 Re { ... } * u
+        val_h = np.einsum("pm,m,mi,ijk->pjk", di31, t1, u2d, d1) + np.einsum(
+            "pm,m,mi,ijk->pjk", di32, t2, u2d, d2
+        )
 
-            di31 = (1.0 / z1_2 - 1.0 / z1_1) / den1
-            di32 = (1.0 / z2_2 - 1.0 / z2_1) / den2
-
-            tm = t_boundary[2 * m : 2 * m + 2]
-            um = u_boundary[2 * m : 2 * m + 2]
-
-            P_mat = np.array([[self.p1, self.p2], [self.q1, self.q2]])
-            Q_mat = np.array([[self.mu1, self.mu2], [-1.0, -1.0]], dtype=complex)
-
-            for j in range(2):  # displacement component
-                for k in range(2):  # derivative wrt x_k
-                    grad_z1 = 1.0 if k == 0 else self.mu1
-                    grad_z2 = 1.0 if k == 0 else self.mu2
-
-                    for i in range(2):  # load dir
-                        # dG_ji,k = integral( d/dP_k U ) = - integral( d/dQ_k U )
-                        # Transpose for reciprocity: load-i at Q, response-j at P
-                        val_g = (
-                            P_mat[i, 0] * self.A[j, 0] * di21 * grad_z1
-                            + P_mat[i, 1] * self.A[j, 1] * di22 * grad_z2
-                        )
-                        grad[j, k] += (-2.0 * val_g.real) * tm[i]
-
-                        # dH_ji,k = integral( d/dP_k T ) = - integral( d/dQ_k T )
-                        # val_h = integral( d/dQ_k T )
-                        # Transpose for reciprocity
-                        val_h = (
-                            Q_mat[i, 0]
-                            * (self.mu1 * nx - ny)
-                            * self.A[j, 0]
-                            * di31
-                            * grad_z1
-                            + Q_mat[i, 1]
-                            * (self.mu2 * nx - ny)
-                            * self.A[j, 1]
-                            * di32
-                            * grad_z2
-                        )
-                        grad[j, k] += (2.0 * val_h.real) * um[i]
-
-        return grad
+        return -2.0 * val_g.real + 2.0 * val_h.real
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from panl.analysis.geometry import CircularCutout, PanelGeometry
+from panl.analysis.hmatrix import HMatrix
+from panl.analysis.kernels import BEMKernels
+from panl.analysis.material import OrthotropicMaterial
+from panl.analysis.solver import BEMSolver
+
+
+def make_solver(method):
+    E, nu = 10.0e6, 0.33
+    mat = OrthotropicMaterial(
+        e1=E, e2=E * 1.001, nu12=nu, g12=E / (2 * (1 + nu)), thickness=0.1
+    )
+    geom = PanelGeometry(30.0, 15.0)
+    geom.add_cutout(CircularCutout(15.0, 7.5, 1.5))
+    geom.discretize(num_elements_per_side=40, num_elements_cutout=88)
+    solver = BEMSolver(BEMKernels(mat), geom, method=method)
+    solver.assemble()
+    return solver
+
+
+def test_hmatrix_matvec_matches_dense():
+    dense = make_solver("dense")
+    hm = make_solver("hmatrix")
+
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(2 * dense.M)
+
+    yh = hm.Hop.matvec(x)
+    yg = hm.Gop.matvec(x)
+    assert np.allclose(yh, dense.H @ x, rtol=0, atol=1e-3 * np.abs(dense.H @ x).max())
+    assert np.allclose(yg, dense.G @ x, rtol=0, atol=1e-3 * np.abs(dense.G @ x).max())
+
+
+def test_hmatrix_solve_matches_dense():
+    dense = make_solver("dense")
+    hm = make_solver("hmatrix")
+
+    u_d, t_d = dense.solve(qx=500.0)
+    u_h, t_h = hm.solve(qx=500.0)
+
+    assert np.abs(u_h - u_d).max() <= 1e-2 * np.abs(u_d).max()
+    assert np.abs(t_h - t_d).max() <= 1e-2 * np.abs(t_d).max()
+
+
+def test_hmatrix_rigid_body_sum():
+    hm = make_solver("hmatrix")
+
+    # Rigid-body translation must produce no tractions: H * 1 = 0
+    ones_x = np.zeros(2 * hm.M)
+    ones_x[0::2] = 1.0
+    residual = hm.Hop.matvec(ones_x)
+    assert np.abs(residual).max() < 1e-10
+
+
+def test_hmatrix_aca_compresses_far_field():
+    solver = make_solver("hmatrix")
+    # Some admissible blocks must be stored in low-rank form
+    assert any(V is not None for _, _, _, V in solver.Hop.blocks)
+    assert solver.Hop.memory_compression() < 1.0
+
+
+def test_matrix_free_apply_matches_dense():
+    dense = make_solver("dense")
+    mf = make_solver("matrix_free")
+
+    rng = np.random.default_rng(2)
+    x = rng.standard_normal(2 * dense.M)
+
+    assert np.allclose(mf.apply(x), dense.H @ x)
+
+
+def test_matrix_free_solve_matches_dense():
+    dense = make_solver("dense")
+    mf = make_solver("matrix_free")
+
+    u_d, t_d = dense.solve(qx=500.0)
+    u_m, t_m = mf.solve(qx=500.0)
+
+    # The operator is exact (no compression); only GMRES tolerance separates
+    # the two solutions.
+    assert np.abs(u_m - u_d).max() <= 1e-6 * np.abs(u_d).max()
+    assert np.abs(t_m - t_d).max() <= 1e-6 * np.abs(t_d).max()
+
+
+def test_matrix_free_never_stores_dense():
+    mf = make_solver("matrix_free")
+    assert not hasattr(mf, "H")
+    u, t = mf.solve(qx=500.0)
+    assert not hasattr(mf, "H")
+
+
+def test_unknown_method_raises():
+    E, nu = 10.0e6, 0.33
+    mat = OrthotropicMaterial(
+        e1=E, e2=E * 1.001, nu12=nu, g12=E / (2 * (1 + nu)), thickness=0.1
+    )
+    geom = PanelGeometry(2.0, 2.0)
+    geom.discretize(num_elements_per_side=1)
+    with pytest.raises(ValueError, match="Unknown method"):
+        BEMSolver(BEMKernels(mat), geom, method="magic")
+
+
+def test_hmatrix_direct_build():
+    # Build an HMatrix around a plain dense block evaluator and check matvec
+    rng = np.random.default_rng(1)
+    centers = rng.uniform(0.0, 10.0, size=(64, 2))
+
+    def block_func(src, fld):
+        # Smooth, rank-deficient far-field interaction
+        d = np.linalg.norm(centers[src][:, None, :] - centers[fld][None, :, :], axis=-1)
+        k = 1.0 / (1.0 + d)
+        return np.kron(k, np.ones((2, 2)))
+
+    hm = HMatrix(block_func, centers, eps=1e-6, leaf_size=8)
+    dense = block_func(np.arange(64), np.arange(64))
+
+    x = rng.standard_normal(128)
+    assert np.allclose(hm.matvec(x), dense @ x, atol=1e-4 * np.abs(dense @ x).max())
@@ -87,3 +87,24 @@ def test_plot_results_invalid_type(solved_system):
     solver, u, t = solved_system
     with pytest.raises(ValueError, match="Unknown stress_type"):
         plot_results(solver, u, t, stress_type="invalid")
+
+
+def test_plot_results_stress_grid(solved_system):
+    solver, u, t = solved_system
+    fig = plot_results(solver, u, t, stress_type="xx", grid=(20, 10))
+    assert isinstance(fig, plt.Figure)
+    # The stress-field image should exist with pixels inside the cutout
+    # masked to NaN and the panel extent preserved.
+    images = fig.get_axes()[0].get_images()
+    assert len(images) == 1
+    data = images[0].get_array()
+    assert data.shape == (10, 20)
+    assert np.isnan(np.asarray(data)[5, 10])  # center pixel is in the cutout
+    assert np.isfinite(np.asarray(data)[0, 0])
+    plt.close(fig)
+
+
+def test_cutout_contains():
+    cut = CircularCutout(5.0, 5.0, 1.0)
+    pts = np.array([[5.0, 5.0], [5.9, 5.0], [6.1, 5.0], [0.0, 0.0]])
+    assert np.array_equal(cut.contains(pts), [True, True, False, False])
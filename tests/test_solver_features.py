@@ -236,3 +236,150 @@ def test_default_tension_stress():
     pts = np.array([[1.0, 1.0]])
     stresses = solver.compute_stress(pts, u, t)
     np.testing.assert_allclose(stresses[0, 0], stress_applied, rtol=1e-2)
+
+
+def test_solve_fp32_matches_fp64():
+    E, thickness = 10.0e6, 0.1
+    mat = OrthotropicMaterial(
+        e1=E, e2=E * 1.001, nu12=0.3, g12=E / 2.6, thickness=thickness
+    )
+    W, H = 2.0, 2.0
+    geom = PanelGeometry(W, H)
+    geom.discretize(num_elements_per_side=10)
+
+    solver64 = BEMSolver(BEMKernels(mat), geom)
+    solver64.assemble()
+    u64, t64 = solver64.solve(qx=100.0)
+
+    solver32 = BEMSolver(BEMKernels(mat), geom, dtype=np.float32)
+    solver32.assemble()
+    assert solver32.H.dtype == np.float32
+    u32, t32 = solver32.solve(qx=100.0)
+
+    # Single precision is plenty for the few digits SCF work needs
+    assert np.abs(u32 - u64).max() <= 1e-4 * np.abs(u64).max()
+    assert np.abs(t32 - t64).max() <= 1e-4 * np.abs(t64).max()
+
+
+def test_solver_invalid_dtype():
+    E = 10.0e6
+    mat = OrthotropicMaterial(e1=E, e2=E * 1.001, nu12=0.3, g12=E / 2.6)
+    geom = PanelGeometry(2.0, 2.0)
+    geom.discretize(num_elements_per_side=1)
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        BEMSolver(BEMKernels(mat), geom, dtype=np.int32)
+
+
+def test_discretize_panelwise_ordering():
+    # Assembly and boundary-stress differencing rely on elements being
+    # emitted in contiguous runs per boundary, sorted along each run.
+    geom = PanelGeometry(4.0, 2.0)
+    from panl.analysis.geometry import CircularCutout
+
+    geom.add_cutout(CircularCutout(2.0, 1.0, 0.5))
+    geom.discretize(num_elements_per_side=8, num_elements_cutout=16)
+
+    runs = [
+        geom.bottom_idx,
+        geom.right_idx,
+        geom.top_idx,
+        geom.left_idx,
+        geom.cutout_idx,
+    ]
+
+    # Runs are contiguous and cover the whole mesh in order
+    expected_start = 0
+    for run in runs:
+        np.testing.assert_array_equal(run, np.arange(expected_start, run[-1] + 1))
+        expected_start = run[-1] + 1
+    assert expected_start == len(geom.elements)
+
+    # Each run is sorted by arc length: consecutive elements share a node
+    for run in runs:
+        for a, b in zip(run[:-1], run[1:]):
+            np.testing.assert_allclose(geom.elements[a].p2, geom.elements[b].p1)
+
+
+def test_discretize_edge_tags():
+    from panl.analysis.geometry import (
+        EDGE_BOTTOM,
+        EDGE_LEFT,
+        EDGE_NONE,
+        EDGE_RIGHT,
+        EDGE_TOP,
+        CircularCutout,
+    )
+
+    geom = PanelGeometry(4.0, 2.0)
+    geom.add_cutout(CircularCutout(2.0, 1.0, 0.5))
+    geom.discretize(num_elements_per_side=8, num_elements_cutout=16)
+
+    # Integer tags agree with the recorded edge index runs
+    for tag, run in [
+        (EDGE_BOTTOM, geom.bottom_idx),
+        (EDGE_RIGHT, geom.right_idx),
+        (EDGE_TOP, geom.top_idx),
+        (EDGE_LEFT, geom.left_idx),
+        (EDGE_NONE, geom.cutout_idx),
+    ]:
+        np.testing.assert_array_equal(np.where(geom.edge_tags == tag)[0], run)
+
+
+def _make_cache_solver(n_side=2, e2_factor=1.001, dtype=np.float64):
+    E = 10.0e6
+    mat = OrthotropicMaterial(e1=E, e2=E * e2_factor, nu12=0.3, g12=E / 2.6)
+    geom = PanelGeometry(2.0, 2.0)
+    geom.discretize(num_elements_per_side=n_side)
+    return BEMSolver(BEMKernels(mat), geom, dtype=dtype)
+
+
+def test_assembly_cache_roundtrip(tmp_path):
+    solver = _make_cache_solver()
+
+    # Cold run: miss, assemble, write
+    assert len(list(tmp_path.iterdir())) == 0
+    solver.assemble(use_cache=True, cache_dir=tmp_path)
+    cache_files = list(tmp_path.glob("assembly_*.npz"))
+    assert len(cache_files) == 1
+    H_fresh, G_fresh = solver.H.copy(), solver.G.copy()
+
+    # Warm run on a fresh solver: hit, matrices identical to assembly
+    again = _make_cache_solver()
+    again.assemble(use_cache=True, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("assembly_*.npz"))) == 1
+    np.testing.assert_array_equal(again.H, H_fresh)
+    np.testing.assert_array_equal(again.G, G_fresh)
+
+
+def test_assembly_cache_key_sensitivity():
+    base = _make_cache_solver()
+
+    # Any change to the mesh, material, or precision must miss the cache
+    finer = _make_cache_solver(n_side=3)
+    stiffer = _make_cache_solver(e2_factor=1.5)
+    narrow = _make_cache_solver(dtype=np.float32)
+
+    keys = {s._cache_key() for s in (base, finer, stiffer, narrow)}
+    assert len(keys) == 4
+    # Same configuration reproduces the same key
+    assert base._cache_key() == _make_cache_solver()._cache_key()
+
+
+def test_lu_reuse_across_solves(sample_setup):
+    solver, W, H, h = sample_setup
+
+    u1, t1 = solver.solve(qx=100.0)
+    lu_first = solver._lu
+    assert lu_first is not None
+
+    # Same constraint pattern, different load: factorization is reused
+    u2, t2 = solver.solve(qx=200.0)
+    assert solver._lu is lu_first
+    np.testing.assert_allclose(u2, 2.0 * u1, rtol=1e-8, atol=1e-14)
+
+    # A different constraint pattern forces a refactorization
+    bc_type = np.zeros(2 * solver.M, dtype=int)
+    bc_value = np.zeros(2 * solver.M)
+    bc_type[0:4] = 1
+    solver.solve(bc_type, bc_value)
+    assert solver._lu is not lu_first